@@ -29,23 +29,63 @@ Incremental improvements (Mar 2026):
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import os
 import re
+import string
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse
 import yaml
 from dateutil import parser as dtparser
 
-from .fetch import Item, fetch_full_text, fetch_html_index, fetch_rss, is_probably_taxonomy_or_hub
+try:
+    import orjson  # optional: faster debug JSON dumps
+except Exception:  # pragma: no cover
+    orjson = None
+
+from .fetch import Item, fetch_full_text_many, fetch_html_index, fetch_rss, is_probably_taxonomy_or_hub
 from .summarise import build_digest
-from .utils import normalise_domain
+from .utils import normalise_domain, query_keys, substring_re
+
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+# libyaml's C loader when PyYAML was built with it (same safe subset, much faster on big configs)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
+def _load_yaml(path: Path) -> Any:
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Indented UTF-8 JSON, as json.dumps(ensure_ascii=False, indent=2) writes it (orjson when installed)."""
+    if orjson is not None:
+        try:
+            path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            return
+        except TypeError:  # e.g. int beyond 64 bits: leave it to json
+            pass
+    path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+# URL/text heuristics below run per candidate: compile their patterns once.
+_URL_TAIL_RE = re.compile(r"[?#].*$")
+_URL_ORIGIN_RE = re.compile(r"^https?://[^/]+")
+_PEOPLE_SLUG_RE = re.compile(
+    r"(executive[-_]?leadership|leadership[-_]?team|board[-_]?members?|advisory[-_]?panel|our[-_]?people|executive[-_]?team)"
+)
+_YEAR_RE = re.compile(r"(20\d{2})")
+_NUMBER_RE = re.compile(r"\b\d{2,}\b")
+_UNIT_RE = re.compile(r"\b(MW|GW|MWh|GWh|A\$|€|USD|AUD|%|\btonnes?\b|\btCO2e\b)\b", re.I)
 
 
 def _norm_title(s: str) -> str:
@@ -54,9 +94,8 @@ def _norm_title(s: str) -> str:
     for p in ("report:", "report -", "report ", "media release:", "media release -", "announcement:", "update:"):
         if s.startswith(p):
             s = s[len(p):].strip()
-    s = re.sub(r"[^\w\s]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = _NON_WORD_RE.sub(" ", s)
+    return " ".join(s.split())
 
 
 OUT_DIR = Path(os.getenv("OUT_DIR", "out"))
@@ -159,6 +198,14 @@ RANGE_PAD_AFTER_DAYS = int(os.getenv("RANGE_PAD_AFTER_DAYS", os.getenv("RANGE_PA
 # Scoring/selection budget: how many candidates per section we spend full-text fetch on.
 MAX_SCORE_FETCHES_PER_SECTION = int(os.getenv("MAX_SCORE_FETCHES_PER_SECTION", "60"))
 
+# Feeds/index pages of a section fetched concurrently (network-bound; 1 = one at a time).
+SOURCE_FETCH_WORKERS = int(os.getenv("SOURCE_FETCH_WORKERS", "6"))
+
+# Full texts kept in memory for the run, so strict/relaxed/fallback/last-resort passes and
+# later sections don't refetch a URL (oldest evicted past this many; 0 = disabled).
+# Only non-empty texts are kept: failed fetches are retried by later passes.
+FULLTEXT_CACHE_MAX = int(os.getenv("FULLTEXT_CACHE_MAX", "2000"))
+
 # Last-resort backfill (only used when a section returns zero items after strict+relaxed).
 # Kept tight (14 days) so that last-resort articles don't stray into the previous month.
 # Enough to reach a quiet news week at the start of the target month.
@@ -243,9 +290,32 @@ def _month_range(ym: str) -> Tuple[date, date]:
     return start, end
 
 
+@lru_cache(maxsize=8192)
+def _coerce_iso(s: str) -> Optional[datetime]:
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        dt = dtparser.isoparse(s)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        return None
+
+
 def _coerce_ts(ts: Any) -> Optional[datetime]:
     if ts is None:
         return None
+    # Exact-type fast paths for what Item actually carries (published_ts float, published_iso str).
+    t = type(ts)
+    if t is float or t is int:
+        try:
+            return datetime.fromtimestamp(ts, tz=timezone.utc)
+        except Exception:
+            return None
+    if t is str:
+        return _coerce_iso(ts)
     if isinstance(ts, datetime):
         if ts.tzinfo is None:
             return ts.replace(tzinfo=timezone.utc)
@@ -258,16 +328,7 @@ def _coerce_ts(ts: Any) -> Optional[datetime]:
         except Exception:
             return None
     if isinstance(ts, str):
-        s = ts.strip()
-        if not s:
-            return None
-        try:
-            dt = dtparser.isoparse(s)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:
-            return None
+        return _coerce_iso(str(ts))
     return None
 
 
@@ -300,21 +361,41 @@ def _in_range(ts: Any, start: Any, end: Any) -> bool:
     return s2 <= ts2 <= e2
 
 
+@lru_cache(maxsize=65536)
 def _is_priority(url: str) -> bool:
     d = normalise_domain(url)
     return (d in PRIORITY_DOMAINS) if PRIORITY_DOMAINS else False
 
 
+_ASCII_LETTERS = string.ascii_letters.encode("ascii")
+
+
+def _letter_count(text: str) -> int:
+    """sum(c.isalpha() for c in text), without a Python-level loop per character."""
+    if text.isascii():
+        # ASCII letters are exactly [A-Za-z]: delete them in one C pass and count the gap.
+        raw = text.encode("ascii")
+        return len(raw) - len(raw.translate(None, _ASCII_LETTERS))
+    return sum(map(str.isalpha, text))
+
+
+def _has_letters(text: str, need: float, chunk: int = 4096) -> bool:
+    """True once `text` holds at least `need` letters; stops counting at the first chunk that gets there."""
+    letters = 0
+    for i in range(0, len(text), chunk):
+        letters += _letter_count(text[i:i + chunk])
+        if letters >= need:
+            return True
+    return letters >= need
+
+
 def _substance_ok(text: str, is_priority: bool) -> bool:
     if not text:
         return False
     min_chars = PRIORITY_MIN_CHARS if is_priority else MIN_TEXT_CHARS
     if len(text) < min_chars:
         return False
-    letters = sum(c.isalpha() for c in text)
-    if letters < min(150, len(text) * 0.08):
-        return False
-    return True
+    return _has_letters(text, min(150, len(text) * 0.08))
 
 
 def _substance_ok_relaxed(text: str) -> bool:
@@ -323,10 +404,25 @@ def _substance_ok_relaxed(text: str) -> bool:
         return False
     if len(text) < RELAXED_MIN_TEXT_CHARS:
         return False
-    letters = sum(c.isalpha() for c in text)
-    if letters < min(80, len(text) * 0.05):
-        return False
-    return True
+    return _has_letters(text, min(80, len(text) * 0.05))
+
+
+_EVERGREEN_SEGMENTS = frozenset({
+    "about", "contact", "privacy", "terms", "cookies", "cookie-policy", "accessibility", "sitemap",
+    "careers", "jobs", "vacancies",
+    "search", "login", "signin", "sign-in", "subscribe", "newsletter",
+    "board", "governance", "leadership", "executive", "executives", "management", "team", "teams",
+    "advisory", "advisory-panel", "advisorypanel",
+    "our-people", "people", "who-we-are", "organisation", "organization",
+    "media-centre", "media-center", "pressroom", "newsroom",
+})
+_POSITIVE_SEGMENTS = frozenset({
+    "news", "media", "press", "releases", "release", "announcements", "announcement",
+    "updates", "insights", "blog",
+    "publications", "publication", "reports", "report",
+    "consultations", "consultation",
+    "statements", "statement",
+})
 
 
 def _looks_articleish(url: str) -> bool:
@@ -345,8 +441,8 @@ def _looks_articleish(url: str) -> bool:
     if is_probably_taxonomy_or_hub(ul):
         return False
 
-    clean = re.sub(r"[?#].*$", "", ul)
-    path = re.sub(r"^https?://[^/]+", "", clean) or "/"
+    clean = _URL_TAIL_RE.sub("", ul)
+    path = _URL_ORIGIN_RE.sub("", clean) or "/"
     if path in ("", "/"):
         return False
 
@@ -354,36 +450,17 @@ def _looks_articleish(url: str) -> bool:
     if not segs:
         return False
 
-    evergreen_segments = {
-        "about", "contact", "privacy", "terms", "cookies", "cookie-policy", "accessibility", "sitemap",
-        "careers", "jobs", "vacancies",
-        "search", "login", "signin", "sign-in", "subscribe", "newsletter",
-        "board", "governance", "leadership", "executive", "executives", "management", "team", "teams",
-        "advisory", "advisory-panel", "advisorypanel",
-        "our-people", "people", "who-we-are", "organisation", "organization",
-        "media-centre", "media-center", "pressroom", "newsroom",
-    }
-    if any(seg in evergreen_segments for seg in segs):
+    if not _EVERGREEN_SEGMENTS.isdisjoint(segs):
         return False
 
     slug = segs[-1]
-    if re.search(
-        r"(executive[-_]?leadership|leadership[-_]?team|board[-_]?members?|advisory[-_]?panel|our[-_]?people|executive[-_]?team)",
-        slug,
-    ):
+    if _PEOPLE_SLUG_RE.search(slug):
         return False
 
     is_pdf = slug.endswith(".pdf")
 
-    positive_parts = {
-        "news", "media", "press", "releases", "release", "announcements", "announcement",
-        "updates", "insights", "blog",
-        "publications", "publication", "reports", "report",
-        "consultations", "consultation",
-        "statements", "statement",
-    }
-    has_positive = any(seg in positive_parts for seg in segs)
-    has_year = bool(re.search(r"(20\d{2})", path))
+    has_positive = not _POSITIVE_SEGMENTS.isdisjoint(segs)
+    has_year = bool(_YEAR_RE.search(path))
     has_long_slug = len(slug) >= 18
 
     if is_pdf:
@@ -398,6 +475,43 @@ def _looks_articleish(url: str) -> bool:
     return has_long_slug
 
 
+class _DomainMatcher:
+    """
+    Domain patterns as a trie keyed by reversed labels, so a lookup is one walk down the
+    domain's labels rather than one test per pattern. Same semantics as
+    Filters._match_domain_pattern: "x.org" and "*.x.org" match x.org and its subdomains.
+    """
+
+    __slots__ = ("trie", "odd")
+
+    def __init__(self, patterns):
+        self.trie: Dict[Any, Any] = {}
+        self.odd: List[str] = []  # "*..x"-style patterns carry an extra exact match; test them directly
+        for pattern in patterns:
+            p = str(pattern or "").lower().strip()
+            if p.startswith("*."):
+                p = p[2:]
+                if p.startswith("."):
+                    self.odd.append("*." + p)
+                    continue
+            elif not p:
+                continue
+            node = self.trie
+            for label in reversed(p.split(".")):
+                node = node.setdefault(label, {})
+            node[None] = True  # a pattern ends here
+
+    def __call__(self, domain: str) -> bool:
+        node = self.trie
+        for label in reversed(domain.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            if None in node:
+                return True
+        return any(Filters._match_domain_pattern(domain, p) for p in self.odd) if self.odd else False
+
+
 class Filters:
     def __init__(self, raw: Dict[str, Any]):
         # allow/deny lists from config (supporting alias keys)
@@ -422,6 +536,10 @@ class Filters:
             for k, v in (raw.get("section_keywords", {}) or {}).items()
             if isinstance(v, list)
         }
+        # Stripped, non-empty keywords per section, prepared once for _kw_hits.
+        self.section_terms: Dict[str, Tuple[str, ...]] = {
+            k: tuple(t for t in (w.strip() for w in v) if t) for k, v in self.section_keywords.items()
+        }
 
         # Per-domain URL substring denylists (domain_pattern -> [url_substring,...])
         self.domain_deny_substrings: Dict[str, List[str]] = {}
@@ -447,12 +565,19 @@ class Filters:
         for s in BUILTIN_DENY_URL_SUBSTRINGS:
             if s not in self.deny_url_substrings:
                 self.deny_url_substrings.append(s)
+        # All deny substrings as one trie-shaped pattern: a single scan per URL instead of one `in` each.
+        self._deny_url_rx = substring_re(self.deny_url_substrings)
         for rx in BUILTIN_DENY_TITLE_REGEX:
             try:
                 self.deny_title_regex.append(re.compile(rx, re.I))
             except Exception:
                 pass
 
+        # Domain lists as reversed-label tries (see _DomainMatcher).
+        self._deny_match = _DomainMatcher(self.deny_domains)
+        self._allow_match = _DomainMatcher(self.allow_domains)
+        self._auto_allow_match = _DomainMatcher(AUTO_ALLOW_DOMAINS)
+
     @staticmethod
     def _match_domain_pattern(domain: str, pattern: str) -> bool:
         d = (domain or "").lower()
@@ -470,14 +595,14 @@ class Filters:
             return False
 
         if self.allow_domains:
-            if any(self._match_domain_pattern(d, a) for a in self.allow_domains):
+            if self._allow_match(d):
                 return True
 
             # Auto-allow a small set of trusted public domains so that an overly narrow allowlist
             # does not collapse the pool (still subject to deny rules).
             if AUTO_ALLOW_GOV_AU and (d.endswith(".gov.au") or d.endswith(".edu.au")):
                 return True
-            if any(self._match_domain_pattern(d, a) for a in AUTO_ALLOW_DOMAINS):
+            if self._auto_allow_match(d):
                 return True
 
             return False
@@ -486,9 +611,9 @@ class Filters:
 
     def domain_denied(self, domain: str) -> bool:
         d = (domain or "").lower()
-        return any(self._match_domain_pattern(d, x) for x in self.deny_domains)
+        return bool(d) and self._deny_match(d)
 
-def _passes_filters(it: Item, flt: Filters, section: str, *, bypass_allow: bool = False) -> Tuple[bool, str]:
+def _passes_filters(it: Item, flt: Filters, section: str, *, bypass_allow: bool = False, ul: Optional[str] = None) -> Tuple[bool, str]:
     url = (it.url or "").strip()
     title = (it.title or "").strip()
     if not url or not title:
@@ -504,7 +629,7 @@ def _passes_filters(it: Item, flt: Filters, section: str, *, bypass_allow: bool
     if (not bypass_allow) and (not flt.domain_allowed(domain)):
         return False, "not_in_allowlist"
 
-    u = url.lower()
+    u = ul if ul is not None else url.lower()  # callers that already lowercased the URL pass it in
 
     # Per-domain URL substring denylists (filters.yaml)
     for dom_pat, subs in (flt.domain_deny_substrings or {}).items():
@@ -513,9 +638,8 @@ def _passes_filters(it: Item, flt: Filters, section: str, *, bypass_allow: bool
                 if ss and ss in u:
                     return False, "domain_deny_substring"
 
-    for ss in flt.deny_url_substrings:
-        if ss and ss in u:
-            return False, "deny_url_substring"
+    if flt._deny_url_rx.search(u):
+        return False, "deny_url_substring"
 
     for rx in flt.deny_title_regex:
         if rx.search(title):
@@ -527,7 +651,7 @@ def _passes_filters(it: Item, flt: Filters, section: str, *, bypass_allow: bool
     if domain.endswith("arena.gov.au") and _item_is_undated(it):
         if any(s in u for s in ("/funding", "/opportunities", "/programs", "/initiative", "/grants")):
             return False, "evergreen_program_page"
-    if domain.endswith("efrag.org") and (urlparse(url.lower()).path.rstrip("/") in ("/en/news-and-calendar/news", "/en/news-and-calendar/events")):
+    if domain.endswith("efrag.org") and (urlparse(u).path.rstrip("/") in ("/en/news-and-calendar/news", "/en/news-and-calendar/events")):
         return False, "hub_url"
 
     # Generic / non-informative titles should not be selected even if URL looks OK.
@@ -538,27 +662,17 @@ def _passes_filters(it: Item, flt: Filters, section: str, *, bypass_allow: bool
 
 
 def _keyword_boost(title: str, section: str, flt: Filters) -> float:
-    kws = flt.section_keywords.get(section, [])
-    if not kws:
-        return 0.0
-    t = title.lower()
-    hits = sum(1 for k in kws if k and k in t)
+    hits = _kw_hits(title, flt.section_terms.get(section, ()))
     return min(1.0, hits * 0.15)
 
 
 
-def _kw_hits(text: str, kws: Sequence[str]) -> int:
-    t = (text or "").lower()
-    if not t or not kws:
+def _kw_hits(text: str, terms: Sequence[str]) -> int:
+    """Number of `terms` (lowercase, stripped, non-empty: Filters.section_terms) found in text."""
+    if not terms or not text:
         return 0
-    hits = 0
-    for w in kws:
-        ww = (w or "").strip().lower()
-        if not ww:
-            continue
-        if ww in t:
-            hits += 1
-    return hits
+    t = text.lower()
+    return sum(1 for w in terms if w in t)
 
 
 def _title_quality_penalty(title: str) -> float:
@@ -576,14 +690,15 @@ def _title_quality_penalty(title: str) -> float:
     return 0.0
 
 
+@lru_cache(maxsize=65536)
 def _url_type_penalty(url: str) -> float:
     ul = (url or "").lower()
     if not ul:
         return -1.0
     parsed = urlparse(ul)
-    q = parse_qs(parsed.query or "")
+    q = query_keys(parsed.query)
     # listing-like query facets/pagination
-    if any(k.startswith("f[") for k in q.keys()) or any(k in q for k in ("facet", "facets", "filter", "filters", "page")):
+    if any(k.startswith("f[") for k in q) or any(k in q for k in ("facet", "facets", "filter", "filters", "page")):
         return -0.5
     path = parsed.path or "/"
     # known non-article paths
@@ -621,34 +736,32 @@ def _text_signal(text: str) -> float:
     # log-like growth; cap at ~1.0
     sig = min(1.0, math.log(max(50, n), 10))
     # reward presence of numbers/units (often indicates substance)
-    if re.search(r"\b\d{2,}\b", t):
+    if _NUMBER_RE.search(t):
         sig += 0.15
-    if re.search(r"\b(MW|GW|MWh|GWh|A\$|€|USD|AUD|%|\btonnes?\b|\btCO2e\b)\b", t, re.I):
+    if _UNIT_RE.search(t):
         sig += 0.15
     return sig
 
 
-def _pre_score(it: Item, section: str, flt: Filters, start_dt: datetime, end_dt: datetime) -> float:
-    # Cheap score for deciding fetch budget.
+def _pre_score(it: Item, ts: Optional[datetime], section: str, flt: Filters, start_dt: datetime, end_dt: datetime) -> float:
+    # Cheap score for deciding fetch budget; ts is the caller's _effective_published_ts(it).
     title = (it.title or "")
     url = (it.url or "")
-    ts = _effective_published_ts(it)
     rec = _recency_score(ts, start_dt, end_dt)
     prio = 0.35 if _is_priority(url) else 0.0
-    kw = 0.05 * _kw_hits(title + " " + url, flt.section_keywords.get(section, []))
+    kw = 0.05 * _kw_hits(title + " " + url, flt.section_terms.get(section, ()))
     tq = _title_quality_penalty(title)
     ut = _url_type_penalty(url)
     return rec + prio + kw + tq + ut
 
 
-def _score_item(it: Item, text: str, section: str, flt: Filters, start_dt: datetime, end_dt: datetime) -> Tuple[float, Dict[str, Any]]:
+def _score_item(it: Item, ts: Optional[datetime], text: str, section: str, flt: Filters, start_dt: datetime, end_dt: datetime) -> Tuple[float, Dict[str, Any]]:
     url = it.url or ""
     title = it.title or ""
-    ts = _effective_published_ts(it)
 
     rec = _recency_score(ts, start_dt, end_dt)
     prio = 0.35 if _is_priority(url) else 0.0
-    kw_hits = _kw_hits((title or "") + " " + (text or "") + " " + (url or ""), flt.section_keywords.get(section, []))
+    kw_hits = _kw_hits((title or "") + " " + (text or "") + " " + (url or ""), flt.section_terms.get(section, ()))
     kw = min(0.6, 0.09 * kw_hits)  # raised from 0.06 to better balance against recency
     tq = _title_quality_penalty(title)
     ut = _url_type_penalty(url)
@@ -678,35 +791,125 @@ def _collect_section_pool(section: str, sec_cfg: Dict[str, Any]) -> Tuple[List[I
             it.section = section
             pool.append(it)
 
-    for entry in (sec_cfg.get("rss") or []):
-        try:
-            url = entry.get("url") if isinstance(entry, dict) else str(entry)
-            name = entry.get("name") if isinstance(entry, dict) else ""
-            add_items(fetch_rss(str(url), source_name=str(name or normalise_domain(str(url)))))
-        except Exception as e:
-            drops.append({"reason": "rss_error", "source": str(entry), "detail": str(e)})
+    def fetch_rss_entry(entry: Any) -> List[Item]:
+        url = entry.get("url") if isinstance(entry, dict) else str(entry)
+        name = entry.get("name") if isinstance(entry, dict) else ""
+        return fetch_rss(str(url), source_name=str(name or normalise_domain(str(url))))
+
+    def fetch_html_entry(entry: Any) -> List[Item]:
+        url = entry.get("url") if isinstance(entry, dict) else str(entry)
+        name = entry.get("name") if isinstance(entry, dict) else ""
+        date_resolve = entry.get("date_resolve_fetches") if isinstance(entry, dict) else None
+        return fetch_html_index(str(url), source_name=str(name or normalise_domain(str(url))), max_date_resolve_fetches=date_resolve)
+
+    jobs = [(fetch_rss_entry, "rss_error", e) for e in (sec_cfg.get("rss") or [])]
+    jobs += [(fetch_html_entry, "html_index_error", e) for e in (sec_cfg.get("html") or [])]
 
-    for entry in (sec_cfg.get("html") or []):
+    def run(job: Tuple[Any, str, Any]) -> Tuple[Optional[List[Item]], Optional[Exception]]:
+        fn, _reason, entry = job
         try:
-            url = entry.get("url") if isinstance(entry, dict) else str(entry)
-            name = entry.get("name") if isinstance(entry, dict) else ""
-            date_resolve = entry.get("date_resolve_fetches") if isinstance(entry, dict) else None
-            add_items(fetch_html_index(str(url), source_name=str(name or normalise_domain(str(url))), max_date_resolve_fetches=date_resolve))
+            return fn(entry), None
         except Exception as e:
-            drops.append({"reason": "html_index_error", "source": str(entry), "detail": str(e)})
+            return None, e
 
-    # URL dedup
-    seen: Set[str] = set()
-    deduped: List[Item] = []
+    # Sources overlap on the network; results are merged in config order (dedup keeps the first).
+    workers = max(1, min(SOURCE_FETCH_WORKERS, len(jobs)))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(run, jobs))
+    else:
+        results = [run(j) for j in jobs]
+
+    for (_fn, reason, entry), (items, err) in zip(jobs, results):
+        if err is not None:
+            drops.append({"reason": reason, "source": str(entry), "detail": str(err)})
+        else:
+            add_items(items or [])
+
+    # URL dedup (first occurrence wins; dict keeps insertion order)
+    by_url: Dict[str, Item] = {}
     for it in pool:
         key = (it.url or "").strip().lower()
-        if not key or key in seen:
+        if key:
+            by_url.setdefault(key, it)
+
+    return list(by_url.values()), drops
+
+
+
+_FULLTEXT_CACHE: Dict[str, str] = {}
+
+
+def _full_texts(urls: List[str]) -> Dict[str, str]:
+    """
+    Stripped full text per URL ("" when nothing could be extracted). URLs fetched earlier in
+    the run come from _FULLTEXT_CACHE; the rest are fetched concurrently (network-bound).
+    Empty results are not cached, so a timeout or 5xx in one pass is retried by the next.
+    """
+    out = {u: _FULLTEXT_CACHE[u] for u in urls if u in _FULLTEXT_CACHE}
+    missing = [u for u in dict.fromkeys(urls) if u not in out]
+    if missing:
+        try:
+            fetched = fetch_full_text_many(missing)
+        except Exception:
+            return {**{u: "" for u in missing}, **out}
+        for u in missing:
+            out[u] = (fetched.get(u) or "").strip()
+            if not out[u] or FULLTEXT_CACHE_MAX <= 0:
+                continue
+            if len(_FULLTEXT_CACHE) >= FULLTEXT_CACHE_MAX:
+                del _FULLTEXT_CACHE[next(iter(_FULLTEXT_CACHE))]
+            _FULLTEXT_CACHE[u] = out[u]
+    return out
+
+
+# (lowercased url or None, drop record or None, (pre_score, lowercased url, item) or None)
+_Prefiltered = Tuple[Optional[str], Optional[Dict[str, str]], Optional[Tuple[float, str, Item]]]
+
+
+def _prefilter_pool(
+    pool: Sequence[Item],
+    section: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    flt: Filters,
+    *,
+    bypass_allow: bool = False,
+) -> List[_Prefiltered]:
+    """
+    Stage 1 of _select_from_pool for every pool item: filters, date window, pre-score.
+    Independent of the pass (strict/relaxed) and of exclusions, so both passes over the
+    same window can share one evaluation; exclusions are applied by the caller.
+    """
+    window_start = start_dt - timedelta(days=max(0, RANGE_PAD_BEFORE_DAYS))
+    window_end = end_dt + timedelta(days=max(0, RANGE_PAD_AFTER_DAYS))
+    # Coerce the window once; ts_eff below is already a UTC datetime, so each item
+    # needs a plain comparison rather than a full _in_range() coercion.
+    lo, hi = _coerce_ts(window_start), _coerce_ts(window_end)
+
+    out: List[_Prefiltered] = []
+    for it in pool:
+        url = (it.url or "").strip()
+        if not url:
+            out.append((None, {"reason": "missing_url", "url": "", "title": it.title or ""}, None))
+            continue
+        ul = url.lower()
+
+        ok, why = _passes_filters(it, flt, section, bypass_allow=bypass_allow, ul=ul)
+        if not ok:
+            out.append((ul, {"reason": why, "url": url, "title": it.title or ""}, None))
             continue
-        seen.add(key)
-        deduped.append(it)
 
-    return deduped, drops
+        ts_eff = _effective_published_ts(it)
+        if ts_eff is None and (not ALLOW_UNDATED):
+            out.append((ul, {"reason": "undated", "url": url, "title": it.title or ""}, None))
+            continue
+        if ts_eff is not None and lo is not None and hi is not None and not (lo <= ts_eff <= hi):
+            out.append((ul, {"reason": "out_of_range", "url": url, "title": it.title or ""}, None))
+            continue
 
+        out.append((ul, None, (_pre_score(it, ts_eff, section, flt, start_dt, end_dt), ul, it)))
+    return out
 
 
 def _select_from_pool(
@@ -722,6 +925,7 @@ def _select_from_pool(
     bypass_allow: bool = False,
     exclude_urls: Optional[Set[str]] = None,
     initial_per_domain: Optional[Dict[str, int]] = None,
+    prefiltered: Optional[List[_Prefiltered]] = None,
 ) -> Tuple[List[Item], List[Dict[str, str]]]:
     """
     Score-driven selector (deterministic):
@@ -732,6 +936,8 @@ def _select_from_pool(
 
     strict=True: enforces MIN_TEXT_CHARS / PRIORITY_MIN_CHARS via _substance_ok()
     strict=False: enforces RELAXED_MIN_TEXT_CHARS via _substance_ok_relaxed()
+
+    prefiltered: output of _prefilter_pool for the same pool/section/window/filters.
     """
     drops: List[Dict[str, str]] = []
     selected: List[Item] = []
@@ -740,35 +946,24 @@ def _select_from_pool(
     text_cache: Dict[str, str] = {}
     seen_keys: Set[str] = set()
 
-    window_start = start_dt - timedelta(days=max(0, RANGE_PAD_BEFORE_DAYS))
-    window_end = end_dt + timedelta(days=max(0, RANGE_PAD_AFTER_DAYS))
-
-    # 1) Filter + pre-score
+    # 1) Filter + pre-score (shared between passes over the same window when prefiltered)
+    if prefiltered is None:
+        prefiltered = _prefilter_pool(pool, section, start_dt, end_dt, flt, bypass_allow=bypass_allow)
     cand: List[Tuple[float, str, Item]] = []
-    for it in pool:
-        url = (it.url or "").strip()
-        if not url:
-            drops.append({"reason": "missing_url", "url": "", "title": it.title or ""})
+    for ul, drop, c in prefiltered:
+        if ul is not None and ul in ex:
             continue
-        ul = url.lower()
-        if ul in ex:
-            continue
-
-        ok, why = _passes_filters(it, flt, section, bypass_allow=bypass_allow)
-        if not ok:
-            drops.append({"reason": why, "url": url, "title": it.title or ""})
-            continue
-
-        ts_eff = _effective_published_ts(it)
-        if ts_eff is None and (not ALLOW_UNDATED):
-            drops.append({"reason": "undated", "url": url, "title": it.title or ""})
+        if drop is not None:
+            drops.append(dict(drop))
             continue
-        if ts_eff is not None and (not _in_range(ts_eff, window_start, window_end)):
-            drops.append({"reason": "out_of_range", "url": url, "title": it.title or ""})
+        # Domains already at cap (from an earlier pass) can never be picked below:
+        # drop them here so they don't consume the fetch budget.
+        url = (c[2].url or "").strip()
+        domain = normalise_domain(url)
+        if per_domain.get(domain, 0) >= per_domain_cap:
+            drops.append({"reason": "per_domain_cap", "url": url, "title": c[2].title or "", "domain": domain})
             continue
-
-        ps = _pre_score(it, section, flt, start_dt, end_dt)
-        cand.append((ps, ul, it))
+        cand.append(c)
 
     # deterministic ordering: score desc, url asc
     cand.sort(key=lambda x: (-x[0], x[1]))
@@ -776,24 +971,24 @@ def _select_from_pool(
     # 2) Fetch budget: attempt full text for top candidates (only if needed)
     budget = max(0, MAX_SCORE_FETCHES_PER_SECTION)
     to_fetch = cand[:budget]
+    pending: Dict[str, str] = {}  # url -> summary to fall back on, fetched together below
     for _, _, it in to_fetch:
         url = (it.url or "").strip()
         if not url:
             continue
-        if url in text_cache:
+        if url in text_cache or url in pending:
             continue
         # If we already have a reasonable summary, we may skip fetch unless strict.
         base_text = (it.summary or "").strip()
         need_fetch = strict or (len(base_text) < max(200, RELAXED_MIN_TEXT_CHARS))
-        text = base_text
         if need_fetch:
-            try:
-                text = (fetch_full_text(url) or "").strip()
-            except Exception:
-                text = ""
-            if not text:
-                text = base_text
-        text_cache[url] = text
+            pending[url] = base_text
+        else:
+            text_cache[url] = base_text
+    if pending:
+        fetched = _full_texts(list(pending))
+        for url, base_text in pending.items():
+            text_cache[url] = fetched[url] or base_text
 
     # 3) Full scoring
     scored: List[Tuple[float, str, Item, Dict[str, Any], str]] = []
@@ -812,10 +1007,10 @@ def _select_from_pool(
                 drops.append({"reason": "low_substance_relaxed", "url": url, "title": it.title or ""})
                 continue
 
-        sc, meta = _score_item(it, text, section, flt, start_dt, end_dt)
+        dt = _effective_published_ts(it)
+        sc, meta = _score_item(it, dt, text, section, flt, start_dt, end_dt)
 
         # Stable dedupe key: domain + published day + normalised title (fallback to url)
-        dt = _effective_published_ts(it)
         day = dt.strftime("%Y-%m-%d") if dt else "undated"
         key = f"{normalise_domain(url)}|{day}|{_norm_title(it.title or '')}"
         scored.append((sc, ul, it, meta, key))
@@ -875,10 +1070,11 @@ def _last_resort_pick(
     Goal: avoid 'selected=0' while not pulling obvious garbage.
     """
     drops: List[Dict[str, str]] = []
-    scored: List[Tuple[float, str, Item, Dict[str, Any]]] = []
+    scored: List[Tuple[float, str, Item, Dict[str, Any], str]] = []
 
     backfill_start = start_dt - timedelta(days=max(0, LAST_RESORT_BACKFILL_DAYS))
     backfill_end = end_dt  # do not go into the future
+    lo, hi = _coerce_ts(backfill_start), _coerce_ts(backfill_end)
 
     fetches = 0
 
@@ -888,7 +1084,7 @@ def _last_resort_pick(
             continue
         ul = url.lower()
 
-        ok, why = _passes_filters(it, flt, section, bypass_allow=True)
+        ok, why = _passes_filters(it, flt, section, bypass_allow=True, ul=ul)
         if not ok:
             drops.append({"reason": why, "url": url, "title": it.title or ""})
             continue
@@ -899,7 +1095,7 @@ def _last_resort_pick(
             if (end_dt - ts_eff).total_seconds() / 86400.0 > max(0, LAST_RESORT_MAX_STALENESS_DAYS) and (not _is_priority(url)):
                 drops.append({"reason": "too_stale_last_resort", "url": url, "title": it.title or ""})
                 continue
-            if not _in_range(ts_eff, backfill_start, backfill_end):
+            if lo is not None and hi is not None and not (lo <= ts_eff <= hi):
                 drops.append({"reason": "out_of_range_last_resort", "url": url, "title": it.title or ""})
                 continue
         elif not ALLOW_UNDATED:
@@ -909,10 +1105,7 @@ def _last_resort_pick(
         text = (it.summary or "").strip()
         if (len(text) < max(150, RELAXED_MIN_TEXT_CHARS)) and fetches < max(0, LAST_RESORT_MAX_FETCHES):
             fetches += 1
-            try:
-                ft = (fetch_full_text(url) or "").strip()
-            except Exception:
-                ft = ""
+            ft = _full_texts([url])[url]
             if ft:
                 text = ft
 
@@ -920,21 +1113,26 @@ def _last_resort_pick(
             drops.append({"reason": "low_substance_last_resort", "url": url, "title": it.title or ""})
             continue
 
-        sc, meta = _score_item(it, text, section, flt, backfill_start, backfill_end)
+        sc, meta = _score_item(it, ts_eff, text, section, flt, backfill_start, backfill_end)
         meta["last_resort"] = True
-        scored.append((sc, ul, it, meta))
+        day = ts_eff.strftime("%Y-%m-%d") if ts_eff else "undated"
+        scored.append((sc, ul, it, meta, day))
 
-    scored.sort(key=lambda x: (-x[0], x[1]))
+    # Only a handful of items are needed, so pop in (score desc, url asc) order from a
+    # heap instead of sorting the whole pool; the index keeps ties in pool order.
+    order = [(-x[0], x[1], i) for i, x in enumerate(scored)]
+    heapq.heapify(order)
     picked: List[Item] = []
     seen: Set[str] = set()
     per_dom: Dict[str, int] = {}
 
-    for sc, ul, it, meta in scored:
+    while order:
+        sc, ul, it, meta, day = scored[heapq.heappop(order)[2]]
         url = (it.url or "").strip()
         dom = normalise_domain(url)
         if per_dom.get(dom, 0) >= PER_DOMAIN_CAP:
             continue
-        k = f"{dom}|{_norm_title(it.title or '')}|{_effective_published_ts(it).strftime('%Y-%m-%d') if _effective_published_ts(it) else 'undated'}"
+        k = f"{dom}|{_norm_title(it.title or '')}|{day}"
         if k in seen:
             continue
         setattr(it, "_score", float(sc))
@@ -987,10 +1185,13 @@ def generate_for_month(ym: str, cfg_sources: Dict[str, Any], flt: Filters) -> No
 
         if DEBUG:
             pool_path = OUT_DIR / f"debug-pool-{_slug(section)}-{ym}.json"
-            pool_path.write_text(json.dumps([asdict(it) for it in pool], ensure_ascii=False, indent=2), encoding="utf-8")
+            _write_json(pool_path, [asdict(it) for it in pool])
 
         print(f"[pool] candidates: {len(pool)}")
 
+        # Filters/date window/pre-score once for both passes over the month window
+        prefiltered = _prefilter_pool(pool, section, start_dt, end_dt, flt)
+
         # Pass 1 (strict)
         selected, drops1 = _select_from_pool(
             pool, section, start_dt, end_dt, flt,
@@ -998,6 +1199,7 @@ def generate_for_month(ym: str, cfg_sources: Dict[str, Any], flt: Filters) -> No
             per_domain_cap=PER_DOMAIN_CAP,
             strict=True,
             exclude_urls=global_used_urls,
+            prefiltered=prefiltered,
         )
         all_drops.extend(drops1)
         for it in selected:
@@ -1006,7 +1208,6 @@ def generate_for_month(ym: str, cfg_sources: Dict[str, Any], flt: Filters) -> No
 
         # Pass 2 (relaxed fill): only to top up to quota, and still enforces minimum substance
         if len(selected) < ITEMS_PER_SECTION:
-            used = {it.url.lower() for it in selected if it.url}
             per_dom = Counter(normalise_domain(it.url) for it in selected if it.url)
             filler, drops2 = _select_from_pool(
                 pool, section, start_dt, end_dt, flt,
@@ -1015,6 +1216,7 @@ def generate_for_month(ym: str, cfg_sources: Dict[str, Any], flt: Filters) -> No
                 strict=False,
                 exclude_urls=global_used_urls,
                 initial_per_domain=dict(per_dom),
+                prefiltered=prefiltered,
             )
             all_drops.extend(drops2)
             selected.extend(filler)
@@ -1104,23 +1306,19 @@ def generate_for_month(ym: str, cfg_sources: Dict[str, Any], flt: Filters) -> No
             raise SystemExit(f"ERROR: selected items is {len(all_selected)} but MIN_TOTAL_ITEMS={MIN_TOTAL_ITEMS}")
 
     sel_path = OUT_DIR / f"debug-selected-{ym}.json"
-    sel_path.write_text(
-        json.dumps(
-            [
-                {
-                    "section": getattr(it, "section", "") or "",
-                    "title": it.title,
-                    "url": it.url,
-                    "publisher": it.source,
-                    "published": getattr(it, "published_iso", None) or None,
-                    "published_ts": getattr(it, "published_ts", None),
-                }
-                for it in all_selected
-            ],
-            ensure_ascii=False,
-            indent=2,
-        ),
-        encoding="utf-8",
+    _write_json(
+        sel_path,
+        [
+            {
+                "section": getattr(it, "section", "") or "",
+                "title": it.title,
+                "url": it.url,
+                "publisher": it.source,
+                "published": getattr(it, "published_iso", None) or None,
+                "published_ts": getattr(it, "published_ts", None),
+            }
+            for it in all_selected
+        ],
     )
 
     meta_path = OUT_DIR / f"debug-meta-{ym}.txt"
@@ -1224,7 +1422,7 @@ def _generate_grants_radar(ym: str) -> str:
         return ""
 
     try:
-        raw = yaml.safe_load(CFG_GRANTS.read_text(encoding="utf-8")) or {}
+        raw = _load_yaml(CFG_GRANTS) or {}
     except Exception as e:
         print(f"[grants] failed to load {CFG_GRANTS}: {e}")
         return ""
@@ -1300,7 +1498,7 @@ def _generate_grants_radar(ym: str) -> str:
     # ── Render ────────────────────────────────────────────────────────────────
 
     def _clean(s: Any) -> str:
-        return re.sub(r"\s+", " ", str(s or "")).strip()
+        return " ".join(str(s or "").split())
 
     def _render_entry(e: Dict, show_deadline_label: bool = True) -> str:
         name = _clean(e.get("name"))
@@ -1371,8 +1569,8 @@ def _iter_months(start_ym: str, end_ym: str) -> List[str]:
 
 
 def main() -> None:
-    cfg_sources = yaml.safe_load(CFG_SOURCES.read_text(encoding="utf-8"))
-    flt_raw = yaml.safe_load(CFG_FILTERS.read_text(encoding="utf-8"))
+    cfg_sources = _load_yaml(CFG_SOURCES)
+    flt_raw = _load_yaml(CFG_FILTERS)
     flt = Filters(flt_raw or {})
 
     mode = os.getenv("MODE", "backfill-months").strip()
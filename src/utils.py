@@ -1,7 +1,9 @@
-import hashlib, re
+import hashlib
+import re
 import urllib.parse
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional, Set
 
 
 def sha1(s: str) -> str:
@@ -9,7 +11,7 @@ def sha1(s: str) -> str:
 
 
 def normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return " ".join((text or "").split())
 
 
 def today_iso(tz: Optional[str] = None) -> str:
@@ -17,6 +19,8 @@ def today_iso(tz: Optional[str] = None) -> str:
     return datetime.now(timezone.utc).date().isoformat()
 
 
+# Called several times per candidate (filters, scoring, dedupe keys, domain caps).
+@lru_cache(maxsize=65536)
 def normalise_domain(url: str) -> str:
     """Normalise a URL's domain for consistent counting / caps (e.g., strip www.)."""
     dom = urllib.parse.urlparse(url).netloc.lower()
@@ -24,3 +28,42 @@ def normalise_domain(url: str) -> str:
         dom = dom[4:]
     dom = dom.rstrip(".")
     return dom
+
+
+def query_keys(query: str) -> Set[str]:
+    """
+    Keys of a URL query string, as parse_qs(query).keys() would give them (keys with a
+    blank value are dropped, keys are percent-decoded) without building the dict of lists.
+    """
+    keys: Set[str] = set()
+    for kv in (query or "").split("&"):
+        k, _eq, v = kv.partition("=")
+        if not v:
+            continue
+        keys.add(urllib.parse.unquote_plus(k) if ("%" in k or "+" in k) else k)
+    return keys
+
+
+def substring_re(words) -> re.Pattern:
+    """
+    Compile literal substrings into one trie-shaped alternation, so `pattern.search(s)` is
+    equivalent to `any(w in s for w in words)` but walks the string once in C.
+    """
+    trie: Dict[str, Any] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    if not trie:
+        return re.compile(r"(?!)")  # never matches, like any() over an empty list
+
+    def build(node: Dict[str, Any]) -> str:
+        alts = [re.escape(ch) + build(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        # a word ends here: whatever follows is optional
+        return "(?:" + body + ")?" if "" in node else body
+
+    return re.compile(build(trie))